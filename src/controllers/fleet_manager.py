@@ -1,7 +1,9 @@
 from models.robot import Robot
 from typing import List, Dict, Optional, Any
-import threading 
-from threading import Lock 
+import time
+import numpy as np
+import threading
+from threading import Lock
 
 class FleetManager:
     """Class responsible for managing a fleet of robots and their operations"""
@@ -9,14 +11,18 @@ class FleetManager:
     def __init__(self, traffic_manager):
         # List to store all robots in the fleet
         self.robots: List[Robot] = []
+        # Index for O(1) robot lookup by ID
+        self._by_id: Dict[int, Robot] = {}
         # Store reference to traffic manager for coordinating robot movements
         self.traffic_manager = traffic_manager
         # ID of currently selected robot (if any)
         self.selected_robot: Optional[int] = None
         # Counter for generating unique robot IDs
         self.next_id = 1
-        # Thread lock for thread-safe operations
-        self._lock = Lock()
+        # Short lock guarding fleet state (robots, _by_id, next_id)
+        self._fleet_lock = Lock()
+        # Separate lock for stdout so log I/O never blocks fleet mutation
+        self._log_lock = Lock()
 
     # def spawn_robot(self, vertex_idx: int, nav_graph) -> Robot:
     #     """Create new robot with proper dependencies"""
@@ -30,23 +36,60 @@ class FleetManager:
         # Create new robot instance with unique ID, starting position, and navigation graph
         robot = Robot(self.next_id, vertex_idx, nav_graph)
         
-        # Use lock to safely modify shared resources
-        with self._lock:
+        # Hold the fleet lock only around the mutation, not the logging
+        with self._fleet_lock:
             # Add robot to fleet
             self.robots.append(robot)
+            self._by_id[robot.id] = robot
             # Increment ID counter for next robot
             self.next_id += 1
-            
-        # Log robot creation
+
+        # Log robot creation (outside the fleet lock)
         self._log(f"✅ Robot {robot.id} spawned at vertex {vertex_idx}")
         return robot
 
     def update_robots(self, delta_time: float):
         """Update all robots with traffic manager"""
-        # Update each robot's state based on elapsed time
+        # Split the fleet: robots moving along a granted lane take a
+        # batched kinematic step; everything else (lane requests,
+        # charging, low battery) keeps the full per-robot update
+        moving = []
+        eventful = []
         for robot in self.robots:
+            if (robot.status == "moving"
+                    and robot.current_lane is not None
+                    and robot.current_lane == robot._next_lane):
+                moving.append(robot)
+            else:
+                eventful.append(robot)
+
+        now = time.monotonic()
+
+        if moving:
+            count = len(moving)
+            speed = np.fromiter((r.config.movement_speed for r in moving), dtype=np.float32, count=count)
+            drain = np.fromiter((r.config.battery_drain_rate for r in moving), dtype=np.float32, count=count)
+            min_batt = np.fromiter((r.config.min_battery for r in moving), dtype=np.float32, count=count)
+            progress = np.fromiter((r.progress for r in moving), dtype=np.float32, count=count)
+            battery = np.fromiter((r.battery for r in moving), dtype=np.float32, count=count)
+            new_progress = progress + speed * delta_time
+            new_battery = np.maximum(0.0, battery - drain * delta_time)
+            # Cruising = no transition this tick: stays on the lane and
+            # battery was already above the low-battery threshold
+            cruising = (new_progress < 1.0) & (battery >= min_batt)
+            for i, robot in enumerate(moving):
+                if cruising[i]:
+                    robot.progress = float(new_progress[i])
+                    robot.battery = float(new_battery[i])
+                    robot.last_update_time = now
+                else:
+                    # Arrival or low battery: run the full state machine,
+                    # which applies its own kinematic step
+                    eventful.append(robot)
+
+        for robot in eventful:
             # Pass traffic manager to handle collision avoidance
-            robot.update(self.traffic_manager, delta_time)
+            robot.update(self.traffic_manager, delta_time, now)
 
     # def assign_task(self, robot_id: int, destination_idx: int) -> bool:
     #     """Assign destination to specific robot"""
@@ -87,7 +130,7 @@ class FleetManager:
                 'path': []
             }
 
-        # Calculate shortest path to destination
+        # Calculate shortest path to destination (NavGraph caches per pair)
         path = nav_graph.get_shortest_path(robot.current_vertex, destination_idx)
         if not path:
             return {
@@ -107,10 +150,32 @@ class FleetManager:
             'path': path
         }
 
+    def get_all_positions(self) -> np.ndarray:
+        """Interpolated positions of all robots as an (R, 2) float32 array"""
+        robots = self.robots
+        if not robots:
+            return np.empty((0, 2), dtype=np.float32)
+
+        count = len(robots)
+        coords = robots[0].nav_graph.coords
+        # Idle robots lerp from their vertex to itself with progress 0
+        starts = np.fromiter(
+            (r.current_lane[0] if r.current_lane else r.current_vertex for r in robots),
+            dtype=np.int32, count=count)
+        ends = np.fromiter(
+            (r.current_lane[1] if r.current_lane else r.current_vertex for r in robots),
+            dtype=np.int32, count=count)
+        progress = np.fromiter(
+            (r.progress if r.current_lane else 0.0 for r in robots),
+            dtype=np.float32, count=count)
+
+        start_pos = coords[starts]
+        return start_pos + (coords[ends] - start_pos) * progress[:, None]
+
     def get_robot(self, robot_id: int) -> Optional[Robot]:
         """Get robot by ID"""
-        # Find and return robot with matching ID, or None if not found
-        return next((r for r in self.robots if r.id == robot_id), None)
+        # O(1) lookup through the ID index
+        return self._by_id.get(robot_id)
 
     def select_robot(self, robot_id: Optional[int]):
         """Select/deselect a robot"""
@@ -121,12 +186,13 @@ class FleetManager:
         """Reset the fleet"""
         # Remove all robots from fleet
         self.robots.clear()
+        self._by_id.clear()
         # Reset ID counter
         self.next_id = 1
         # Clear selected robot
         self.selected_robot = None
     def _log(self, message: str):
         """Thread-safe logging"""
-        # Use lock to ensure thread-safe logging
-        with self._lock:
+        # Serialize stdout access only; fleet state is never touched here
+        with self._log_lock:
             print(message)  # Print message (could be modified to write to file)
\ No newline at end of file
@@ -1,51 +1,116 @@
 # controllers/traffic_manager.py (updated)
 import time
-from enum import Enum, auto
-from typing import Dict, Tuple, List, Any, Set
+import numpy as np
+from collections import deque, namedtuple
+from enum import IntEnum
+from typing import Deque, Dict, Tuple, List, Any, Set
 
-class LaneEvent(Enum):
-    GRANTED = auto()
-    RELEASED = auto()
-    QUEUED = auto()
-    TIMEOUT = auto()
-    BLOCKED = auto()
+# Compact slotted record for traffic events; cheaper than a dict per event
+LaneLogEntry = namedtuple('LaneLogEntry', 'timestamp event robot_id lane')
+
+class LaneEvent(IntEnum):
+    GRANTED = 1
+    RELEASED = 2
+    QUEUED = 3
+    TIMEOUT = 4
+    BLOCKED = 5
 
 class TrafficManager:
-    def __init__(self):
+    def __init__(self, nav_graph=None):
         self.occupied_lanes: Dict[Tuple[int, int], int] = {}  # {lane: robot_id}
-        self.waiting_queues: Dict[Tuple[int, int], List[int]] = {}  # FIFO queues
+        self.waiting_queues: Dict[Tuple[int, int], Deque[int]] = {}  # FIFO queues
+        self._queued_robots: Dict[Tuple[int, int], Set[int]] = {}  # O(1) dedupe per lane
         self.occupation_timestamps: Dict[Tuple[int, int], float] = {}
-        self.last_deadlock_check = time.time()
+        self._reverse_occupied: Set[Tuple[int, int]] = set()  # reverse tuples of occupied lanes
+        self._rev: Dict[Tuple[int, int], Tuple[int, int]] = {}  # interned reverse tuples
+        self._collisions: Set[frozenset] = set()  # unordered vertex pairs occupied both ways
+        self.last_deadlock_check = time.monotonic()
+        self.event_log: Deque[LaneLogEntry] = deque(maxlen=1000)  # bounded history
+        self.verbose = False  # emit formatted prints only when enabled
+
+        # Compact integer-ID representation of the lane set, built when the
+        # nav graph is known: owner array indexed by lane id (-1 = free) and
+        # a reverse-lane id map. The tuple-keyed dicts above stay as the
+        # iteration-friendly view for the GUI.
+        self._lane_id: Dict[Tuple[int, int], int] = {}
+        self._rev_lane_id: np.ndarray = np.empty(0, dtype=np.int32)
+        self._lane_owner: np.ndarray = np.empty(0, dtype=np.int32)
+        if nav_graph is not None:
+            self._register_lanes(nav_graph)
+
+    def _register_lanes(self, nav_graph):
+        """Adopt the nav graph's lane IDs and map IDs to reverse IDs"""
+        self._lane_id = dict(nav_graph.lane_id)
+        num_lanes = len(self._lane_id)
+        self._rev_lane_id = np.full(num_lanes, -1, dtype=np.int32)
+        for lane, lane_id in self._lane_id.items():
+            rev_id = self._lane_id.get(self._reverse(lane))
+            if rev_id is not None:
+                self._rev_lane_id[lane_id] = rev_id
+        self._lane_owner = np.full(num_lanes, -1, dtype=np.int32)
 
     # In controllers/traffic_manager.py (inside TrafficManager class)
     def is_lane_available(self, lane: Tuple[int, int]) -> bool:
         """Check if lane and reverse lane are free"""
+        lane_id = self._lane_id.get(lane)
+        if lane_id is not None:
+            # One hash, then int32 array reads for both directions
+            if self._lane_owner[lane_id] >= 0:
+                return False
+            rev_id = self._rev_lane_id[lane_id]
+            return rev_id < 0 or self._lane_owner[rev_id] < 0
         return (
-            lane not in self.occupied_lanes and 
-            (lane[1], lane[0]) not in self.occupied_lanes
+            lane not in self.occupied_lanes and
+            lane not in self._reverse_occupied
         )
 
+    def _reverse(self, lane: Tuple[int, int]) -> Tuple[int, int]:
+        """Return the reverse lane tuple, interned to avoid re-allocation"""
+        rev = self._rev.get(lane)
+        if rev is None:
+            rev = (lane[1], lane[0])
+            self._rev[lane] = rev
+            self._rev[rev] = lane
+        return rev
+
+    def _mark_occupied(self, lane: Tuple[int, int]):
+        """Update reverse-lane index and collision set after a grant"""
+        rev = self._reverse(lane)
+        self._reverse_occupied.add(rev)
+        lane_id = self._lane_id.get(lane)
+        if lane_id is not None:
+            self._lane_owner[lane_id] = self.occupied_lanes[lane]
+        # Reverse lane occupied too -> both directions in use on this edge.
+        # First-hop lanes are degenerate (v, v) tuples and their own
+        # reverse, so they never collide head-on; a one-element frozenset
+        # here would break detect_collisions' pair unpacking
+        if rev != lane and rev in self.occupied_lanes:
+            self._collisions.add(frozenset(lane))
+
+    def _mark_released(self, lane: Tuple[int, int]):
+        """Update reverse-lane index and collision set after a release"""
+        self._reverse_occupied.discard(self._reverse(lane))
+        lane_id = self._lane_id.get(lane)
+        if lane_id is not None:
+            self._lane_owner[lane_id] = -1
+        self._collisions.discard(frozenset(lane))
+
     def request_lane(self, robot_id: int, lane: Tuple[int, int]) -> bool:
         """Request lane access with deadlock prevention"""
         
-        lane = tuple(lane) if isinstance(lane, list) else lane
-        current_time = time.time()
+        current_time = time.monotonic()
 
         if self.detect_collisions(lane):
             self._log_event(LaneEvent.BLOCKED, robot_id, lane)
             return False
         
         # Check if lane is available
-        if lane not in self.occupied_lanes and (lane[1], lane[0]) not in self.occupied_lanes:
-            self.occupied_lanes[lane] = robot_id
-            self.occupation_timestamps[lane] = current_time
+        if self.is_lane_available(lane):
+            self._grant_access(robot_id, lane)
             return True
-            
+
         # If not available, add to queue
-        if lane not in self.waiting_queues:
-            self.waiting_queues[lane] = []
-        if robot_id not in self.waiting_queues[lane]:
-            self.waiting_queues[lane].append(robot_id)
+        self._enqueue_robot(robot_id, lane)
         return False
 
     def release_lane(self, lane: Tuple[int, int]):
@@ -54,103 +119,63 @@ class TrafficManager:
             del self.occupied_lanes[lane]
             if lane in self.occupation_timestamps:
                 del self.occupation_timestamps[lane]
+            self._mark_released(lane)
             
         # Process queue if any robots waiting
         if lane in self.waiting_queues and self.waiting_queues[lane]:
-            next_robot = self.waiting_queues[lane].pop(0)
+            next_robot = self.waiting_queues[lane].popleft()
+            self._queued_robots[lane].discard(next_robot)
             # Don't automatically grant - let robot request again
 
     def update_movement_status(self, lane: Tuple[int, int], robot_id: int, is_moving: bool):
         """Track movement status (no changes needed)"""
         pass
 
-    def _perform_periodic_checks(self):
-        """Check for timeouts (called from robot update)"""
-        current_time = time.time()
-        if current_time - self.last_deadlock_check > 2.0:
-            self.last_deadlock_check = current_time
-            stale_lanes = [
-                lane for lane, ts in self.occupation_timestamps.items()
-                if current_time - ts > 5.0
-            ]
-            for lane in stale_lanes:
-                self.release_lane(lane)
-
-    def _is_lane_available(self, lane: Tuple[int, int]) -> bool:
-        """Check lane availability considering bidirectional traffic"""
-        reverse_lane = (lane[1], lane[0])
-        return (
-            lane not in self.occupied_lanes and
-            reverse_lane not in self.occupied_lanes
-        )
+    def tick(self, now: float):
+        """Once-per-frame maintenance: release lanes held past the timeout"""
+        if now - self.last_deadlock_check > 2.0:
+            self.last_deadlock_check = now
+            self.resolve_deadlocks(now)
 
     def _grant_access(self, robot_id: int, lane: Tuple[int, int]):
         """Grant lane access to robot"""
         self.occupied_lanes[lane] = robot_id
-        self.occupation_timestamps[lane] = time.time()
+        self.occupation_timestamps[lane] = time.monotonic()
+        self._mark_occupied(lane)
         self._remove_from_other_queues(robot_id)
 
     def _enqueue_robot(self, robot_id: int, lane: Tuple[int, int]):
-        """Add robot to waiting queue"""
-        if lane not in self.waiting_queues:
-            self.waiting_queues[lane] = []
-        if robot_id not in self.waiting_queues[lane]:
-            self.waiting_queues[lane].append(robot_id)
-
-    def _process_queue(self, lane: Tuple[int, int]):
-        """Process waiting queue when lane becomes available"""
-        if lane in self.waiting_queues and self.waiting_queues[lane]:
-            next_robot = self.waiting_queues[lane].pop(0)
+        """Add robot to waiting queue (deduped via the parallel set)"""
+        queued = self._queued_robots.setdefault(lane, set())
+        if robot_id not in queued:
+            queued.add(robot_id)
+            self.waiting_queues.setdefault(lane, deque()).append(robot_id)
 
     def _remove_from_other_queues(self, robot_id: int):
         """Remove robot from all queues when granted access"""
-        for queue in self.waiting_queues.values():
-            if robot_id in queue:
+        for lane, queue in self.waiting_queues.items():
+            if robot_id in self._queued_robots.get(lane, ()):
                 queue.remove(robot_id)
-
-    def _resolve_issues(self):
-        """Handle timeouts and deadlocks"""
-        current_time = time.time()
-        # Clear stale lanes
-        stale_lanes = [
-            lane for lane, t in self.occupation_timestamps.items()
-            if current_time - t > 5.0  # 5 second timeout
-        ]
-        for lane in stale_lanes:
-            self._log_event(LaneEvent.TIMEOUT, self.occupied_lanes[lane], lane)
-            self.release_lane(lane)
-        
-        # Check for deadlocks
-        deadlocked_robots = self._find_deadlocks()
-        for robot_id in deadlocked_robots:
-            # Implement deadlock resolution logic here
-            pass
+                self._queued_robots[lane].discard(robot_id)
 
     def _find_deadlocks(self) -> Set[int]:
         """Identify robots involved in circular waits"""
         # Placeholder implementation - returns empty set
         return set()
+
     def _log_event(self, event_type: LaneEvent, robot_id: int, lane: Tuple[int, int]):
-        """Log traffic events with proper timestamp formatting"""
-        if not hasattr(self, 'event_log'):
-            self.event_log = []
-        
-    # Use the parameter name correctly (should match the definition)
-        log_entry = {
-            "timestamp": time.time(),
-            "event": event_type.name,  # Now using the parameter 'event_type'
-            "robot_id": robot_id,
-            "lane": lane
-        }
-        self.event_log.append(log_entry)
-    
-    # Formatted print statement
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-        print(f"[{timestamp}] {event_type.name}: Robot {robot_id} on lane {lane}")
+        """Record a traffic event; format and print only when verbose"""
+        self.event_log.append(LaneLogEntry(time.time(), event_type.name, robot_id, lane))
+
+        # strftime + print cost far more than the event itself; skip unless asked
+        if self.verbose:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+            print(f"[{timestamp}] {event_type.name}: Robot {robot_id} on lane {lane}")
 
     def clear_queues(self):
         """Reset all waiting queues (for simulation reset)"""
         self.waiting_queues.clear()
+        self._queued_robots.clear()
 
     def detect_collisions(self, lane: Tuple[int, int] = None) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
@@ -160,32 +185,37 @@ class TrafficManager:
         Returns:
             List of colliding lane pairs
         """
-        collisions = []
-        occupied_set = set(self.occupied_lanes.keys())
-        
         # If checking specific lane
         if lane is not None:
-            reverse_lane = (lane[1], lane[0])
-            if reverse_lane in occupied_set:
+            lane_id = self._lane_id.get(lane)
+            if lane_id is not None:
+                # Registered lanes resolve through the reverse-ID array
+                rev_id = self._rev_lane_id[lane_id]
+                if rev_id >= 0 and self._lane_owner[rev_id] >= 0:
+                    return [(lane, self._reverse(lane))]
+                return []
+            reverse_lane = self._reverse(lane)
+            if reverse_lane in self.occupied_lanes:
                 return [(lane, reverse_lane)]
             return []
-        
-        # Check all lanes
-        for lane in occupied_set:
-            reverse_lane = (lane[1], lane[0])
-            if reverse_lane in occupied_set:
-                collisions.append((lane, reverse_lane))
-    
-        return collisions
 
-    def resolve_deadlocks(self):
-        """Force-release lanes in deadlock situations"""
+        # All collisions are maintained incrementally on grant/release
+        return [((a, b), (b, a)) for a, b in (tuple(pair) for pair in self._collisions)]
+
+    def resolve_deadlocks(self, now: float = None):
+        """Force-release lanes held past the 5 second timeout"""
+        if now is None:
+            now = time.monotonic()
         for lane in list(self.occupied_lanes.keys()):
-            if time.time() - self.occupation_timestamps.get(lane, 0) > 5:  # 5 sec timeout
-                self.release_lane(lane)
+            if now - self.occupation_timestamps.get(lane, 0) > 5:  # 5 sec timeout
+                # Read the owner before release_lane drops the entry
                 self._log_event(LaneEvent.TIMEOUT, self.occupied_lanes[lane], lane)
+                self.release_lane(lane)
     
     def is_lane_occupied(self, lane: Tuple[int, int]) -> bool:
-        """Check if a specific lane is currently occupied"""
-        lane = tuple(lane) if isinstance(lane, list) else lane
+        """Check if a specific lane is currently occupied (lane must be a tuple)"""
+        lane_id = self._lane_id.get(lane)
+        if lane_id is not None:
+            # Registered lanes resolve through the int32 owner array
+            return bool(self._lane_owner[lane_id] >= 0)
         return lane in self.occupied_lanes
\ No newline at end of file
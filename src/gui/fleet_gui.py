@@ -1,7 +1,13 @@
 import pygame
 import time
 import math
-from typing import Optional, Tuple
+import heapq
+import numpy as np
+try:
+    from scipy.spatial import cKDTree  # Optional: faster nearest-vertex queries
+except ImportError:
+    cKDTree = None
+from typing import Dict, List, Optional, Tuple
 from models.nav_graph import NavGraph
 from controllers.fleet_manager import FleetManager
 from controllers.traffic_manager import TrafficManager
@@ -20,32 +26,101 @@ class FleetGUI:
         self.screen = pygame.display.set_mode((1200, 800))
         pygame.display.set_caption("Fleet Management System")
         self.clock = pygame.time.Clock()
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.monotonic()
 
     def _init_visuals(self):
         self.vertex_radius = 10
         self.robot_radius = 8
+        # Vertex coordinates as a (V, 2) array for vectorized transforms
+        self._verts_np = np.array(
+            [(v[0], v[1]) for v in self.nav_graph.vertices], dtype=np.float32
+        ).reshape(-1, 2)
         self.scale, self.offset = self._calculate_auto_scale()
         self.font_small = pygame.font.SysFont('Arial', 12)
         self.font_medium = pygame.font.SysFont('Arial', 14, bold=True)
         self.font_large = pygame.font.SysFont('Arial', 18)
+        # Rendered text surfaces keyed by (string, color, font) — SDL_ttf
+        # rasterization is expensive and the same strings repeat every frame
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int], int], pygame.Surface] = {}
+        # Per-frame fleet snapshot; refreshed at the top of _draw
+        self._robots_snapshot: Tuple[Robot, ...] = ()
+        # Set by interaction; lets the main loop drop the frame rate when idle
+        self._dirty = True
+        self._build_spatial_index()
+        # Screen positions never change after auto-scale: one vectorized transform
+        self._screen_verts = (
+            self._verts_np * self.scale + np.array(self.offset, dtype=np.float32)
+        ).astype(np.int32)
+        self._vertex_screen_pos = [(int(x), int(y)) for x, y in self._screen_verts]
+        # Static graph (lanes, vertices, labels) is rendered once and blitted per frame
+        self._background = pygame.Surface(self.screen.get_size()).convert()
+        self._render_static(self._background)
+
+    def _text(self, text: str, color: Tuple[int, int, int], font: pygame.font.Font) -> pygame.Surface:
+        """Render text through the surface cache.
+
+        Only for strings drawn from a small recurring set (IDs, labels,
+        counts); one-off strings such as timestamped log lines must use
+        font.render directly or the cache grows without bound.
+        """
+        key = (text, color, id(font))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def _build_spatial_index(self):
+        """Build spatial lookup structures and vertex degree table (once at startup)"""
+        vertices = self.nav_graph.vertices
+        num_vertices = len(vertices)
+
+        # KD-tree gives O(log V) nearest-vertex queries in compiled code;
+        # the hash grid below remains the fallback when scipy is absent
+        self._kd = cKDTree(self._verts_np) if cKDTree is not None and num_vertices else None
+
+        # Estimate average vertex spacing from the graph bounds to pick a cell size
+        if num_vertices > 1:
+            span_x = max(v[0] for v in vertices) - min(v[0] for v in vertices)
+            span_y = max(v[1] for v in vertices) - min(v[1] for v in vertices)
+            avg_spacing = max(span_x, span_y) / math.sqrt(num_vertices)
+        else:
+            avg_spacing = 1.0
+        self._cell_size = max(1.0, 2 * avg_spacing)
+
+        # Grid maps (cell_x, cell_y) -> list of vertex indices in that cell
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        for i, vertex in enumerate(vertices):
+            key = (math.floor(vertex[0] / self._cell_size), math.floor(vertex[1] / self._cell_size))
+            self._grid.setdefault(key, []).append(i)
+
+        # Precompute per-vertex connection counts (used by _draw_vertices)
+        self._degree = [0] * num_vertices
+        for (start_end, meta) in self.nav_graph.lanes:
+            self._degree[start_end[0]] += 1
+            self._degree[start_end[1]] += 1
 
     def run(self):
         """Main GUI loop"""
         running = True
         while running:
-            delta_time = self._handle_events()
-            self._update(delta_time)
-            self._draw()
+            # One clock read per frame; monotonic is immune to wall-clock jumps
+            now = time.monotonic()
+            delta_time = self._handle_events(now)
+            self._update(delta_time, now)
+            self._draw(now)
             pygame.display.flip()
-            self.clock.tick(60)
+            # Run at full rate only while interacting or animating;
+            # an idle scene does not need 60 redraws per second
+            animating = any(robot.status != "idle" for robot in self._robots_snapshot)
+            self.clock.tick(60 if (self._dirty or animating) else 10)
+            self._dirty = False
         pygame.quit()
 
-    def _handle_events(self) -> float:
+    def _handle_events(self, now: float) -> float:
         """Process events and return delta time"""
-        current_time = time.time()
-        delta_time = current_time - self.last_frame_time
-        self.last_frame_time = current_time
+        delta_time = now - self.last_frame_time
+        self.last_frame_time = now
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -56,6 +131,7 @@ class FleetGUI:
 
     def _handle_click(self, event):
         """Handle mouse clicks"""
+        self._dirty = True
         mouse_pos = pygame.mouse.get_pos()
         vertex_idx = self._get_nearest_vertex(mouse_pos)
         
@@ -71,22 +147,29 @@ class FleetGUI:
             if self.fleet.selected_robot:
                 self.fleet.assign_task(self.fleet.selected_robot, vertex_idx)
 
-    def _update(self, delta_time: float):
+    def _update(self, delta_time: float, now: float):
         """Update simulation state"""
+        self.traffic.tick(now)
         self.fleet.update_robots(delta_time)
 
-    def _draw(self):
+    def _draw(self, now: float):
         """Render all elements"""
-        self.screen.fill((255, 255, 255))  # White background
-        
+        # Snapshot the fleet once: spawn_robot may append from another
+        # thread, and the draw helpers below iterate robots several times
+        self._robots_snapshot = tuple(self.fleet.robots)
+        # View rectangle (with margin) for culling off-screen elements
+        self._view_rect = self.screen.get_rect().inflate(40, 40)
+
+        # Static graph comes from the pre-rendered background in one blit
+        self.screen.blit(self._background, (0, 0))
+
         # Draw instructions
         self._draw_instructions()
-        
-        # Draw navigation elements
-        self._draw_lanes()
-        self._draw_vertices()
+
+        # Draw dynamic elements only
+        self._draw_queue_counts()
         self._draw_robots()
-        self._draw_alerts()
+        self._draw_alerts(now)
         self._draw_log_panel()
 
         self._draw_traffic_alerts()
@@ -94,10 +177,15 @@ class FleetGUI:
 
     def _draw_traffic_alerts(self):
         """Show lane occupancy warnings"""
+        # Bind lookups once; this loop is the only per-frame lane pass left
+        _line = pygame.draw.line
+        screen = self.screen
+        positions = self._vertex_screen_pos
+        view_rect = self._view_rect
         for lane in self.traffic.occupied_lanes:
-            start = self._to_screen_coords(self.nav_graph.vertices[lane[0]])
-            end = self._to_screen_coords(self.nav_graph.vertices[lane[1]])
-            pygame.draw.line(self.screen, (255, 100, 100), start, end, 4)  # Red highlight
+            start, end = positions[lane[0]], positions[lane[1]]
+            if view_rect.clipline(start, end):  # Skip fully off-screen lanes
+                _line(screen, (255, 100, 100), start, end, 4)  # Red highlight
 
     def _draw_collision_warnings(self):
         """Show collision markers"""
@@ -107,20 +195,20 @@ class FleetGUI:
             pygame.draw.circle(self.screen, (255, 0, 0), center1, 10)
             pygame.draw.circle(self.screen, (255, 0, 0), center2, 10)
 
-    def _draw_notifications(self):
+    def _draw_notifications(self, now: float):
         """Show pop-up alerts"""
         alerts = []
         
         # Check for robots that have been waiting too long
-        for robot in self.fleet.robots:
-            if robot.status == "waiting" and time.time() - robot.wait_start_time > 2:
+        for robot in self._robots_snapshot:
+            if robot.status == "waiting" and now - robot.wait_start_time > 2:
                 alerts.append(f"Robot {robot.id} blocked at Vertex {robot.current_vertex}")
         
         # Display last 3 alerts
         for i, alert in enumerate(alerts[-3:]):
             alert_surf = pygame.Surface((300, 30))                    # Create surface for alert
             alert_surf.fill((255, 200, 200))                         # Light red background
-            text = self.font_medium.render(alert, True, (200, 0, 0)) # Red text
+            text = self._text(alert, (200, 0, 0), self.font_medium)       # Red text
             alert_surf.blit(text, (5, 5))                            # Draw text on alert surface
             self.screen.blit(alert_surf, (self.screen.get_width() - 310, 10 + i * 35))  # Position alert on screen
 
@@ -129,13 +217,19 @@ class FleetGUI:
         log_surface = pygame.Surface((400, 200))           # Create surface for log panel
         log_surface.fill((240, 240, 240))                 # Light gray background
         
-        # Collect recent logs from all robots
+        # Collect recent logs from all robots (deque indexing is O(1) at the ends)
         all_logs = []
-        for robot in self.fleet.robots:
-            all_logs.extend(robot.log[-2:])               # Get last 2 entries from each robot
-        
-        # Display last 5 log entries
-        for i, entry in enumerate(sorted(all_logs, reverse=True)[:5]):
+        for robot in self._robots_snapshot:
+            log = robot.log
+            if log:
+                all_logs.append(log[-1])
+            if len(log) > 1:
+                all_logs.append(log[-2])
+
+        # Display last 5 log entries without sorting the whole list.
+        # Rendered directly: the timestamp prefix makes every entry a
+        # fresh string, so caching these surfaces would leak
+        for i, entry in enumerate(heapq.nlargest(5, all_logs)):
             text = self.font_small.render(entry[:50], True, (0, 0, 0))  # Render log text
             log_surface.blit(text, (10, 10 + i * 20))                   # Position text in log panel
         
@@ -147,63 +241,66 @@ class FleetGUI:
         instructions = [
             "Left Click: Select/Create Robot",         # Explain left click functionality
             "Right Click: Send Robot to Vertex",       # Explain right click functionality
-            f"Total Robots: {len(self.fleet.robots)}", # Show total number of robots
+            f"Total Robots: {len(self._robots_snapshot)}", # Show total number of robots
             f"Selected Robot: {self.fleet.selected_robot if self.fleet.selected_robot else 'None'}"  # Show currently selected robot
         ]
         
         # Draw each instruction line
         for i, text in enumerate(instructions):
-            text_surface = self.font_large.render(text, True, (0, 0, 0))  # Create text surface in black
+            text_surface = self._text(text, (0, 0, 0), self.font_large)  # Create text surface in black
             self.screen.blit(text_surface, (10, 10 + i * 25))            # Position text with 25px vertical spacing
 
-    def _draw_lanes(self):
-        """Draw navigation lanes between vertices"""
+    def _render_static(self, surface: pygame.Surface):
+        """Render the unchanging graph (lanes, vertices, labels) onto a surface"""
+        surface.fill((255, 255, 255))  # White background
+
+        # Lanes are drawn blue here; occupied-lane recoloring happens per frame
+        _line = pygame.draw.line
+        to_screen = self._to_screen_coords
+        vertices = self.nav_graph.vertices
         for (start_end, meta) in self.nav_graph.lanes:
-            # Convert vertex coordinates to screen coordinates
-            start_pos = self._to_screen_coords(self.nav_graph.vertices[start_end[0]])
-            end_pos = self._to_screen_coords(self.nav_graph.vertices[start_end[1]])
-            
-            # Choose lane color: red if occupied, blue if free
-            color = (255, 0, 0) if start_end in self.traffic.occupied_lanes else (0, 0, 255)
-            pygame.draw.line(self.screen, color, start_pos, end_pos, 2)  # Draw the lane
-            
-            # Draw queue size if robots are waiting
-            if start_end in self.traffic.waiting_queues:
-                queue_count = len(self.traffic.waiting_queues[start_end])
-                if queue_count > 0:
-                    # Show number of waiting robots in orange
-                    text = self.font_small.render(str(queue_count), True, (255, 69, 0))
-                    self.screen.blit(text, (
-                        (start_pos[0] + end_pos[0]) // 2,  # Position text at middle of lane
-                        (start_pos[1] + end_pos[1]) // 2
-                    ))
-
-    def _draw_vertices(self):
-        """Draw all vertices (nodes) in the navigation graph"""
-        for i, vertex in enumerate(self.nav_graph.vertices):
-            pos = self._to_screen_coords(vertex)  # Convert to screen coordinates
+            _line(surface, (0, 0, 255), to_screen(vertices[start_end[0]]), to_screen(vertices[start_end[1]]), 2)
+
+        for i, meta in enumerate(self.nav_graph.vertex_meta):
+            pos = self._vertex_screen_pos[i]
             # Choose vertex color: green for chargers, red for normal vertices
-            color = (0, 255, 0) if vertex[2].get('is_charger') else (255, 0, 0)
-            pygame.draw.circle(self.screen, color, pos, self.vertex_radius)  # Draw vertex circle
-            
+            color = (0, 255, 0) if meta.get('is_charger') else (255, 0, 0)
+            pygame.draw.circle(surface, color, pos, self.vertex_radius)  # Draw vertex circle
+
             # Draw vertex ID in white
-            text_id = self.font_medium.render(str(i), True, (255, 255, 255))
-            self.screen.blit(text_id, (pos[0] - 5, pos[1] - 7))
-            
+            text_id = self._text(str(i), (255, 255, 255), self.font_medium)
+            surface.blit(text_id, (pos[0] - 5, pos[1] - 7))
+
             # Draw vertex name below circle if it exists
-            if len(vertex) > 2 and 'name' in vertex[2]:
-                text_name = self.font_small.render(vertex[2]['name'], True, (0, 0, 0))
-                self.screen.blit(text_name, (pos[0] - 15, pos[1] + 15))
-            
+            if 'name' in meta:
+                text_name = self._text(meta['name'], (0, 0, 0), self.font_small)
+                surface.blit(text_name, (pos[0] - 15, pos[1] + 15))
+
             # Mark intersections (vertices with >2 connections) with a black square
-            connections = sum(1 for lane in self.nav_graph.lanes if i in lane)
-            if connections > 2:
-                pygame.draw.rect(self.screen, (0, 0, 0), (pos[0] - 3, pos[1] - 3, 6, 6))
+            if self._degree[i] > 2:
+                pygame.draw.rect(surface, (0, 0, 0), (pos[0] - 3, pos[1] - 3, 6, 6))
+
+    def _draw_queue_counts(self):
+        """Draw waiting-robot counts on lanes with non-empty queues"""
+        for lane, queue in self.traffic.waiting_queues.items():
+            queue_count = len(queue)
+            if queue_count > 0:
+                start_pos = self._vertex_screen_pos[lane[0]]
+                end_pos = self._vertex_screen_pos[lane[1]]
+                # Show number of waiting robots in orange
+                text = self._text(str(queue_count), (255, 69, 0), self.font_small)
+                self.screen.blit(text, (
+                    (start_pos[0] + end_pos[0]) // 2,  # Position text at middle of lane
+                    (start_pos[1] + end_pos[1]) // 2
+                ))
 
     def _draw_robots(self):
         """Draw all robots with IDs"""
-        for robot in self.fleet.robots:
-            pos = self._to_screen_coords(self.nav_graph.vertices[robot.current_vertex])
+        view_rect = self._view_rect
+        for robot in self._robots_snapshot:
+            pos = self._vertex_screen_pos[robot.current_vertex]
+            if not view_rect.collidepoint(pos):  # Skip off-screen robots
+                continue
             if robot.status == "charging":
                 pygame.draw.polygon(self.screen, (255, 255, 0), 
                     [(pos[0], pos[1] - 10), (pos[0] - 5, pos[1] + 5), (pos[0] + 5, pos[1] + 5)])  # ⚡
@@ -217,20 +314,20 @@ class FleetGUI:
                 pygame.draw.circle(self.screen, (255, 255, 255), pos, self.robot_radius + 2, 2)
             
             # Robot ID
-            text = self.font_small.render(str(robot.id), True, (0, 0, 0))  # Black text
+            text = self._text(str(robot.id), (0, 0, 0), self.font_small)  # Black text
             text_rect = text.get_rect(center=pos)
             self.screen.blit(text, text_rect)
 
-    def _draw_alerts(self):
+    def _draw_alerts(self, now: float):
         alert_msg = None
-        for robot in self.fleet.robots:
-            if robot.status == "waiting" and time.time() - robot.wait_start_time > 5:
+        for robot in self._robots_snapshot:
+            if robot.status == "waiting" and now - robot.wait_start_time > 5:
                 alert_msg = f"Robot {robot.id} blocked at vertex {robot.current_vertex}"
         
         if alert_msg:
             alert_surface = pygame.Surface((400, 40))
             alert_surface.fill((255, 200, 200))
-            text = self.font_large.render(alert_msg, True, (255, 0, 0))
+            text = self._text(alert_msg, (255, 0, 0), self.font_large)
             alert_surface.blit(text, (10, 10))
             self.screen.blit(alert_surface, (self.screen.get_width() // 2 - 200, 10))
 
@@ -245,29 +342,45 @@ class FleetGUI:
         """Find closest vertex to mouse position"""
         graph_x = (mouse_pos[0] - self.offset[0]) / self.scale
         graph_y = (mouse_pos[1] - self.offset[1]) / self.scale
-        
+
+        if self._kd is not None:
+            return int(self._kd.query((graph_x, graph_y))[1])
+
+        # Fallback: scan only the 3x3 block of grid cells around the click
+        cell_x = math.floor(graph_x / self._cell_size)
+        cell_y = math.floor(graph_y / self._cell_size)
+        candidates = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                candidates.extend(self._grid.get((cell_x + dx, cell_y + dy), ()))
+
+        # Fall back to a full scan for clicks far from any vertex
+        if not candidates:
+            candidates = range(len(self._verts_np))
+
+        verts = self._verts_np
         return min(
-            range(len(self.nav_graph.vertices)),
+            candidates,
             key=lambda i: (
-                (self.nav_graph.vertices[i][0] - graph_x)**2 + 
-                (self.nav_graph.vertices[i][1] - graph_y)**2
+                (verts[i, 0] - graph_x)**2 +
+                (verts[i, 1] - graph_y)**2
             )
         )
 
     def _get_robot_at_vertex(self, vertex_idx: int) -> Optional[Robot]:
         """Get robot at specified vertex"""
-        return next((r for r in self.fleet.robots if r.current_vertex == vertex_idx), None)
+        # Build vertex -> robot index on demand (clicks are rare, frames are not)
+        robot_index = {r.current_vertex: r for r in self.fleet.robots}
+        return robot_index.get(vertex_idx)
 
     def _calculate_auto_scale(self) -> Tuple[float, Tuple[float, float]]:
         """Calculate appropriate scale and offset to fit graph on screen"""
         if not self.nav_graph.vertices:
             return 1.0, (0, 0)  # Default values if no vertices
-            
-        # Find bounds of graph
-        min_x = min(v[0] for v in self.nav_graph.vertices)
-        max_x = max(v[0] for v in self.nav_graph.vertices)
-        min_y = min(v[1] for v in self.nav_graph.vertices)
-        max_y = max(v[1] for v in self.nav_graph.vertices)
+
+        # Find bounds of graph in two C passes instead of four Python ones
+        min_x, min_y = self._verts_np.min(axis=0)
+        max_x, max_y = self._verts_np.max(axis=0)
         
         # Calculate scale to fit graph on screen with margins
         scale = min(
@@ -281,8 +394,8 @@ class FleetGUI:
     
     def _get_lane_center(self, lane: Tuple[int, int]) -> Tuple[int, int]:
         """Get the center point of a lane for collision markers"""
-        start_pos = self._to_screen_coords(self.nav_graph.vertices[lane[0]])
-        end_pos = self._to_screen_coords(self.nav_graph.vertices[lane[1]])
+        start_pos = self._vertex_screen_pos[lane[0]]
+        end_pos = self._vertex_screen_pos[lane[1]]
         return (
             (start_pos[0] + end_pos[0]) // 2,
             (start_pos[1] + end_pos[1]) // 2
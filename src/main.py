@@ -14,7 +14,7 @@ def main():
     
     # Load graph and managers
     nav_graph = NavGraph("data/nav_graph.json")
-    traffic_manager = TrafficManager()
+    traffic_manager = TrafficManager(nav_graph)
     fleet_manager = FleetManager(traffic_manager)  # Pass TrafficManager here
     
     gui = FleetGUI(nav_graph, fleet_manager, traffic_manager)
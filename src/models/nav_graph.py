@@ -1,7 +1,110 @@
 # Import required libraries
 import json  # For reading JSON navigation data files
-import networkx as nx  # For graph operations and pathfinding
+try:
+    import orjson  # Optional: much faster JSON parsing at startup
+except ImportError:
+    orjson = None
+import math  # For Euclidean edge weights and the A* heuristic
+import numpy as np  # For vertex coordinate arrays
+import networkx as nx  # Retained for graph bookkeeping (edge queries)
+from heapq import heappush, heappop  # Priority queue for A*
 from typing import List, Dict, Any, Tuple  # Type hints for better code clarity
+try:
+    from numba import njit  # Optional: JIT-compile the A* inner loop
+except ImportError:
+    njit = None
+
+
+def _astar_csr_impl(indptr, indices, weights, coords, src, dst):
+    """A* over CSR arrays returning the predecessor array (numba-compatible).
+
+    Uses a manually-managed binary heap of (f, g, node) rows so the whole
+    loop stays in nopython mode: no dicts, no boxed tuples.
+    """
+    num_vertices = coords.shape[0]
+    dist = np.full(num_vertices, np.inf)
+    came_from = np.full(num_vertices, -1, dtype=np.int32)
+    h_memo = np.full(num_vertices, -1.0)  # h(u) computed once per vertex
+
+    dx = coords[src, 0] - coords[dst, 0]
+    dy = coords[src, 1] - coords[dst, 1]
+    heap = np.empty((64, 3))
+    heap[0, 0] = (dx * dx + dy * dy) ** 0.5
+    heap[0, 1] = 0.0
+    heap[0, 2] = src
+    size = 1
+    dist[src] = 0.0
+
+    while size > 0:
+        g = heap[0, 1]
+        u = int(heap[0, 2])
+        # Pop: move the last row to the root and sift down
+        size -= 1
+        for k in range(3):
+            heap[0, k] = heap[size, k]
+        i = 0
+        while True:
+            left = 2 * i + 1
+            right = left + 1
+            smallest = i
+            if left < size and heap[left, 0] < heap[smallest, 0]:
+                smallest = left
+            if right < size and heap[right, 0] < heap[smallest, 0]:
+                smallest = right
+            if smallest == i:
+                break
+            for k in range(3):
+                tmp = heap[i, k]
+                heap[i, k] = heap[smallest, k]
+                heap[smallest, k] = tmp
+            i = smallest
+
+        if u == dst:
+            break
+        if g > dist[u]:
+            continue  # Stale heap entry
+
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            g_v = g + weights[e]
+            if g_v < dist[v]:
+                dist[v] = g_v
+                came_from[v] = u
+                h_v = h_memo[v]
+                if h_v < 0.0:
+                    dx = coords[v, 0] - coords[dst, 0]
+                    dy = coords[v, 1] - coords[dst, 1]
+                    h_v = (dx * dx + dy * dy) ** 0.5
+                    h_memo[v] = h_v
+                # Push: grow if full, append, sift up
+                if size >= heap.shape[0]:
+                    grown = np.empty((heap.shape[0] * 2, 3))
+                    grown[:size] = heap[:size]
+                    heap = grown
+                heap[size, 0] = g_v + h_v
+                heap[size, 1] = g_v
+                heap[size, 2] = v
+                i = size
+                size += 1
+                while i > 0:
+                    parent = (i - 1) // 2
+                    if heap[i, 0] < heap[parent, 0]:
+                        for k in range(3):
+                            tmp = heap[i, k]
+                            heap[i, k] = heap[parent, k]
+                            heap[parent, k] = tmp
+                        i = parent
+                    else:
+                        break
+    return came_from
+
+
+# Compiled once per process; cache=True persists the machine code on disk
+_astar_csr_jit = njit(cache=True)(_astar_csr_impl) if njit is not None else None
+
+# Shared read-only sentinel for lanes without metadata; avoids building a
+# fresh empty dict per lane during load
+_EMPTY: Dict = {}
 
 class NavGraph:
     """Class representing a navigation graph with vertices and lanes"""
@@ -10,39 +113,265 @@ class NavGraph:
         self.vertices: List[List] = []  # Store vertex information from JSON
         self.lanes: List[Tuple[Tuple[int, int], Dict]] = []  # Store lane information with metadata
         self.graph = nx.DiGraph()  # Create directed graph using networkx
+        # Cache of computed paths keyed by (start, end); robots replan
+        # between the same vertex pairs constantly on this static graph
+        self._path_cache: Dict[Tuple[int, int], List[int]] = {}
         self.load_graph(json_path)  # Load graph data from JSON file
 
     def load_graph(self, json_path: str):
         """Load and parse graph data from JSON file"""
-        with open(json_path, 'r') as f:  # Open JSON file for reading
-            data = json.load(f)  # Parse JSON data into Python dictionary
+        with open(json_path, 'rb') as f:  # Open JSON file for reading
+            # orjson parses the raw bytes several times faster than the
+            # stdlib; both produce the same dict structure
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
             level = data['levels']['level1']  # Access level1 data from JSON
             self.vertices = level['vertices']  # Store vertex information
-           
+
+            # Vertex coordinates as an array; used by the A* heuristic
+            self._coords = np.asarray(
+                [(v[0], v[1]) for v in self.vertices], dtype=np.float64
+            ).reshape(-1, 2)
+            # Public float32 view for rendering/interpolation consumers
+            self.coords = self._coords.astype(np.float32)
+            # Per-vertex metadata split out of the mixed-type rows so
+            # lookups never touch the float coordinates; vertices without
+            # metadata share the read-only sentinel
+            self.vertex_meta: List[Dict] = [
+                v[2] if len(v) > 2 and isinstance(v[2], dict) else _EMPTY
+                for v in self.vertices
+            ]
+            # Charger lookups happen on every battery check; resolve the
+            # metadata once into a set
+            self.charger_vertices = frozenset(
+                i for i, meta in enumerate(self.vertex_meta) if meta.get('is_charger')
+            )
+
             # Process each lane in the level data
             for lane in level['lanes']:
-                if len(lane) >= 3:  # Check if lane has metadata (3 or more elements)
-                    lane_tuple = (lane[0], lane[1])  # Extract start and end vertices
-                    metadata = lane[2] if isinstance(lane[2], dict) else {}  # Get metadata if it exists
-                    self.lanes.append((lane_tuple, metadata))  # Store lane info with metadata
-                    self.graph.add_edge(lane[0], lane[1], **metadata)  # Add edge to graph with metadata
-                else:  # Handle lanes without metadata
-                    lane_tuple = (lane[0], lane[1])  # Extract start and end vertices
-                    self.lanes.append((lane_tuple, {}))  # Store lane info with empty metadata
-                    self.graph.add_edge(lane[0], lane[1])  # Add edge to graph without metadata
+                a, b = lane[0], lane[1]  # Extract start and end vertices
+                # Metadata if it exists (3 or more elements)
+                metadata = lane[2] if len(lane) >= 3 and isinstance(lane[2], dict) else _EMPTY
+                self.lanes.append(((a, b), metadata))  # Store lane info with metadata
+                # Weight edges by Euclidean length so A* with the Euclidean
+                # heuristic stays admissible and finds shortest distances
+                start_v, end_v = self.vertices[a], self.vertices[b]
+                distance = math.dist((start_v[0], start_v[1]), (end_v[0], end_v[1]))
+                # Splat the kwargs only for lanes that actually carry metadata
+                if metadata:
+                    self.graph.add_edge(a, b, weight=distance, **metadata)
+                else:
+                    self.graph.add_edge(a, b, weight=distance)
+
+            # Canonical integer IDs for the lanes, interned once here so
+            # consumers (the traffic manager) can index flat arrays
+            # instead of re-hashing (start, end) tuples
+            self.lane_id: Dict[Tuple[int, int], int] = {}
+            for pair, _meta in self.lanes:
+                if pair not in self.lane_id:
+                    self.lane_id[pair] = len(self.lane_id)
+            self.lane_endpoints = np.fromiter(
+                (v for pair in self.lane_id for v in pair), dtype=np.int32,
+                count=2 * len(self.lane_id),
+            ).reshape(-1, 2)
+
+            # Flat CSR adjacency for the A* hot loop; avoids networkx's
+            # per-neighbor attribute-dict indirection on every relaxation
+            self._build_csr()
+            self._build_components()
+
+    def _build_components(self):
+        """Label each vertex with its (weakly) connected component.
+
+        Queries between different components can never succeed, so
+        get_shortest_path short-circuits them to [] without running A*.
+        Recompute (via load_graph) if the lane set ever changes.
+        """
+        self._comp_id = np.full(len(self.vertices), -1, dtype=np.int32)
+        comp_count = 0
+        for comp_count, component in enumerate(nx.weakly_connected_components(self.graph), start=1):
+            for v in component:
+                self._comp_id[v] = comp_count - 1
+        # Vertices with no lanes at all each get their own label
+        isolated = np.flatnonzero(self._comp_id < 0)
+        self._comp_id[isolated] = comp_count + np.arange(len(isolated), dtype=np.int32)
+
+    def _build_csr(self):
+        """Build CSR arrays (indptr, indices, weights) from the loaded edges"""
+        num_vertices = len(self.vertices)
+        edges = [(u, v, data['weight']) for u, v, data in self.graph.edges(data=True)]
+        counts = np.zeros(num_vertices + 1, dtype=np.int32)
+        for u, _, _ in edges:
+            counts[u + 1] += 1
+        self._indptr = np.cumsum(counts, dtype=np.int32)
+        self._indices = np.empty(len(edges), dtype=np.int32)
+        self._weights = np.empty(len(edges), dtype=np.float32)
+        fill = self._indptr[:-1].copy()
+        for u, v, w in edges:
+            i = fill[u]
+            self._indices[i] = v
+            self._weights[i] = w
+            fill[u] += 1
+        # Reverse CSR (incoming edges) for the backward frontier of the
+        # bidirectional search
+        counts_r = np.zeros(num_vertices + 1, dtype=np.int32)
+        for _, v, _ in edges:
+            counts_r[v + 1] += 1
+        self._indptr_r = np.cumsum(counts_r, dtype=np.int32)
+        self._indices_r = np.empty(len(edges), dtype=np.int32)
+        self._weights_r = np.empty(len(edges), dtype=np.float32)
+        fill = self._indptr_r[:-1].copy()
+        for u, v, w in edges:
+            i = fill[v]
+            self._indices_r[i] = u
+            self._weights_r[i] = w
+            fill[v] += 1
+        # Plain-list views for the pure-Python A* fallback: list indexing
+        # yields cached ints/floats instead of boxing a NumPy scalar per edge
+        self._indptr_list = self._indptr.tolist()
+        self._indices_list = self._indices.tolist()
+        self._weights_list = self._weights.tolist()
+        self._indptr_r_list = self._indptr_r.tolist()
+        self._indices_r_list = self._indices_r.tolist()
+        self._weights_r_list = self._weights_r.tolist()
 
     def get_shortest_path(self, start: int, end: int) -> List[int]:
         """Calculate shortest path between two vertices using A* algorithm"""
-        try:
-            return nx.astar_path(self.graph, start, end)  # Find path using A* algorithm
-        except nx.NetworkXNoPath:
-            return []  # Return empty list if no path exists
+        key = (start, end)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._astar_csr(start, end)
+            self._path_cache[key] = path
+        return list(path)  # Copy so callers can consume it in place
+
+    def _astar_csr(self, start: int, end: int) -> List[int]:
+        """A* over the flat CSR arrays; returns [] when no path exists"""
+        num_vertices = len(self.vertices)
+        if not (0 <= start < num_vertices and 0 <= end < num_vertices):
+            return []
+        if start == end:
+            return [start]
+        # Adjacent destination: with Euclidean edge weights the direct
+        # lane is always shortest, so skip the search setup entirely
+        indptr, indices = self._indptr_list, self._indices_list
+        for i in range(indptr[start], indptr[start + 1]):
+            if indices[i] == end:
+                return [start, end]
+        # Different components never connect; skip the wasted expansion
+        if self._comp_id[start] != self._comp_id[end]:
+            return []
+
+        if _astar_csr_jit is not None:
+            came_from = _astar_csr_jit(self._indptr, self._indices, self._weights,
+                                       self._coords, start, end)
+            if came_from[end] < 0:
+                return []
+            path = [end]
+            while path[-1] != start:
+                path.append(int(came_from[path[-1]]))
+            path.reverse()
+            return path
+
+        return self._bidirectional_astar(start, end)
+
+    def _bidirectional_astar(self, start: int, end: int) -> List[int]:
+        """Bidirectional A* over the CSR lists (pure-Python fallback).
+
+        Runs a forward frontier from start and a backward frontier (over
+        the reverse CSR) from end, expanding roughly half the vertices of
+        a one-sided search on long paths. Uses the balanced potential
+        p(v) = (h_end(v) - h_start(v)) / 2, which keeps the transformed
+        edge weights non-negative in both directions, so the searches are
+        plain Dijkstra in the transformed space and the classic top_f +
+        top_b >= mu termination rule is exact.
+        """
+        num_vertices = len(self.vertices)
+        coords = self._coords
+        sx, sy = coords[start]
+        ex, ey = coords[end]
+        hypot = math.hypot
+
+        # Balanced potential, memoized per vertex for this query
+        p_cache: Dict[int, float] = {}
+
+        def potential(v: int) -> float:
+            p = p_cache.get(v)
+            if p is None:
+                x, y = coords[v]
+                p = (hypot(x - ex, y - ey) - hypot(x - sx, y - sy)) * 0.5
+                p_cache[v] = p
+            return p
+
+        indptr_f, indices_f, weights_f = self._indptr_list, self._indices_list, self._weights_list
+        indptr_b, indices_b, weights_b = self._indptr_r_list, self._indices_r_list, self._weights_r_list
+        dist_f = [math.inf] * num_vertices
+        dist_b = [math.inf] * num_vertices
+        came_f = [-1] * num_vertices
+        came_b = [-1] * num_vertices
+        dist_f[start] = 0.0
+        dist_b[end] = 0.0
+        heap_f = [(0.0, start)]
+        heap_b = [(0.0, end)]
+        mu = math.inf  # best transformed s->t cost found so far
+        meet = -1
+
+        while heap_f and heap_b:
+            # Exact termination: no undiscovered path can beat mu
+            if heap_f[0][0] + heap_b[0][0] >= mu:
+                break
+            # Expand the frontier with the smaller top key
+            if heap_f[0][0] <= heap_b[0][0]:
+                g_u, u = heappop(heap_f)
+                if g_u > dist_f[u]:
+                    continue  # Stale heap entry
+                p_u = potential(u)
+                for i in range(indptr_f[u], indptr_f[u + 1]):
+                    v = indices_f[i]
+                    g_v = g_u + weights_f[i] - p_u + potential(v)
+                    if g_v < dist_f[v]:
+                        dist_f[v] = g_v
+                        came_f[v] = u
+                        heappush(heap_f, (g_v, v))
+                        if g_v + dist_b[v] < mu:
+                            mu = g_v + dist_b[v]
+                            meet = v
+            else:
+                g_u, u = heappop(heap_b)
+                if g_u > dist_b[u]:
+                    continue  # Stale heap entry
+                p_u = potential(u)
+                for i in range(indptr_b[u], indptr_b[u + 1]):
+                    v = indices_b[i]
+                    g_v = g_u + weights_b[i] + p_u - potential(v)
+                    if g_v < dist_b[v]:
+                        dist_b[v] = g_v
+                        came_b[v] = u
+                        heappush(heap_b, (g_v, v))
+                        if g_v + dist_f[v] < mu:
+                            mu = g_v + dist_f[v]
+                            meet = v
+
+        if meet < 0:
+            return []
+        # Stitch the two predecessor chains together at the meeting vertex
+        path = [meet]
+        while path[-1] != start:
+            path.append(came_f[path[-1]])
+        path.reverse()
+        v = came_b[meet]
+        while v >= 0:
+            path.append(v)
+            v = came_b[v]
+        return path
+
+    def invalidate_cache(self):
+        """Drop cached paths (call if the graph or lane availability changes)"""
+        self._path_cache.clear()
 
     def get_vertex_data(self, idx: int) -> Dict[str, Any]:
         """Retrieve metadata for a vertex by its index"""
-        if 0 <= idx < len(self.vertices):  # Check if vertex index is valid
-            return self.vertices[idx][2] if len(self.vertices[idx]) > 2 else {}  # Return metadata if it exists
-        return {}  # Return empty dict if vertex doesn't exist
+        if 0 <= idx < len(self.vertex_meta):  # Check if vertex index is valid
+            return self.vertex_meta[idx]  # Metadata dict (shared empty sentinel if none)
+        return _EMPTY  # Return empty dict if vertex doesn't exist
 
     def is_lane_available(self, lane: Tuple[int, int]) -> bool:
         """Check if lane exists in the graph"""
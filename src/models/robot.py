@@ -1,7 +1,40 @@
+import os
 import time
+import logging
+from collections import deque
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 
+# One buffered file handler for the whole process instead of an
+# open/write/close cycle (three syscalls) on every log line. The path is
+# anchored to the repo root and the handler opens lazily (delay=True) so
+# importing this module never creates a stray file in the current
+# working directory
+_LOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "fleet_logs.txt",
+)
+logger = logging.getLogger("fleet")
+if not logger.handlers:
+    logger.addHandler(logging.FileHandler(_LOG_PATH, delay=True))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Echo log lines to stdout only when debugging
+DEBUG_LOGS = False
+
+# strftime result cached per wall-clock second; _log calls are far more
+# frequent than the string actually changes
+_time_str: Tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    global _time_str
+    second = int(time.time())
+    if second != _time_str[0]:
+        _time_str = (second, time.strftime("%Y-%m-%d %H:%M:%S"))
+    return _time_str[1]
+
 @dataclass
 class RobotConfig:
     battery_drain_rate: float = 0.5
@@ -11,25 +44,36 @@ class RobotConfig:
     movement_speed: float = 1.0
 
 class Robot:
+    # Slots avoid a per-instance __dict__: smaller robots and faster
+    # attribute access in the per-tick update path
+    __slots__ = (
+        'id', 'current_vertex', 'destination', 'path', '_path_idx', 'status',
+        'battery', 'last_update_time', 'wait_start_time', 'config', 'nav_graph',
+        'color', 'current_lane', '_next_lane', '_lookahead_lane', 'progress',
+        'log',
+    )
+
     def __init__(self, robot_id: int, start_vertex_idx: int, nav_graph, config: RobotConfig = RobotConfig()):
         self.id = robot_id
         self.current_vertex = start_vertex_idx
         self.destination: Optional[int] = None
         self.path: List[int] = []
+        self._path_idx = 0  # Cursor into path; avoids O(n) pop(0) per step
         self.status = "idle"
         self.battery = 100.0
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
         self.wait_start_time: Optional[float] = None
         self.config = config
         self.nav_graph = nav_graph
         self.color = self._generate_color(robot_id)
         self.current_lane: Optional[Tuple[int, int]] = None
+        # Lane tuples cached on path/cursor change rather than rebuilt
+        # every tick: the lane to traverse next and the one after it
+        self._next_lane: Optional[Tuple[int, int]] = None
+        self._lookahead_lane: Optional[Tuple[int, int]] = None
         self.progress = 0.0
-        self.log = []
-        with open("fleet_logs.txt", "a") as f:
-            f.write(f"Initialized Robot {self.id}\n")
-            pass
-      # Clear log file on init
+        self.log = deque(maxlen=200)  # bounded so long runs don't grow without limit
+        logger.info("Initialized Robot %s", self.id)
 
     def _generate_color(self, robot_id: int) -> Tuple[int, int, int]:
         return ((robot_id * 50) % 256, (robot_id * 100) % 256, (robot_id * 150) % 256)
@@ -106,13 +150,37 @@ class Robot:
         
         self._log(f"Assigned to vertex {destination_idx} via path: {self.path}")
         return True
+    @property
+    def next_vertex(self) -> Optional[int]:
+        """Next vertex on the path, or None once the path is exhausted"""
+        if self._path_idx < len(self.path):
+            return self.path[self._path_idx]
+        return None
+
+    def _refresh_lane_cache(self):
+        """Rebuild the cached lane tuples after the path or cursor changes"""
+        idx = self._path_idx
+        path = self.path
+        if idx < len(path):
+            self._next_lane = (self.current_vertex, path[idx])
+            self._lookahead_lane = (path[idx], path[idx + 1]) if idx + 1 < len(path) else None
+        else:
+            self._next_lane = None
+            self._lookahead_lane = None
+
     def _calculate_path(self):
         if self.destination is not None:
             self.path = self.nav_graph.get_shortest_path(self.current_vertex, self.destination)
+            self._path_idx = 0
+            self._refresh_lane_cache()
             if not self.path:
                 self.status = "error"
 
-    def update(self, traffic_manager, delta_time: float) -> bool:
+    def update(self, traffic_manager, delta_time: float, now: float = None) -> bool:
+        # The fleet loop passes one timestamp per tick; fall back to our
+        # own clock read for callers that do not provide it
+        if now is None:
+            now = time.monotonic()
         changed = False
 
         if self._check_imminent_collision(traffic_manager, delta_time):
@@ -125,22 +193,22 @@ class Robot:
         elif self.battery < self.config.min_battery:
             self._handle_low_battery()
         elif self.status == "moving":
-            changed = self._handle_movement(traffic_manager, delta_time)
-            if self._check_imminent_collision(traffic_manager, delta_time):  # Pass delta_time
-                self.status = "emergency_stop"
+            # The pre-dispatch collision check above already covers this
+            # tick; re-checking after the step only duplicated the
+            # traffic-manager query with a near-identical progress value
+            changed = self._handle_movement(traffic_manager, delta_time, now)
         elif self.status == "waiting":
-            changed = self._handle_waiting(time.time())
+            changed = self._handle_waiting(now)
 
-        self.last_update_time = time.time()
+        self.last_update_time = now
         return changed
     
     def _check_imminent_collision(self, traffic_manager, delta_time: float) -> bool:
         """Predict collisions 1 second ahead"""
-        if not self.current_lane or len(self.path) < 2:
+        # Cached lane after the current one; None when the path ends here
+        next_lane = self._lookahead_lane
+        if not self.current_lane or next_lane is None:
             return False
-            
-        # Get next lane in path
-        next_lane = (self.path[0], self.path[1])
         
         # Check if lane will be occupied based on current progress + movement speed
         progress_in_1sec = self.progress + (self.config.movement_speed * delta_time)
@@ -148,13 +216,14 @@ class Robot:
             return traffic_manager.is_lane_occupied(next_lane)
         return False
    # models/robot.py (updated movement handling only)
-    def _handle_movement(self, traffic_manager, delta_time: float) -> bool:
-        if not self.path:
+    def _handle_movement(self, traffic_manager, delta_time: float, now: float = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        lane = self._next_lane
+        if lane is None:
             self._log("Movement failed - No path available")
             return False
-
-        next_vertex = self.path[0]
-        lane = (self.current_vertex, next_vertex)
+        next_vertex = lane[1]
 
         # Only request lane if we don't already have it
         if self.current_lane != lane:
@@ -163,7 +232,7 @@ class Robot:
                 self.progress = 0.0
             else:
                 if self.status != "waiting":
-                    self.wait_start_time = time.time()
+                    self.wait_start_time = now
                     self.status = "waiting"
                 return False
 
@@ -171,13 +240,14 @@ class Robot:
         self.progress += delta_time * self.config.movement_speed
         if self.progress >= 1.0:
             self.current_vertex = next_vertex
-            self.path.pop(0)
+            self._path_idx += 1  # O(1) cursor advance instead of shifting the list
+            self._refresh_lane_cache()
             self.progress = 0.0
             if self.current_lane:
                 traffic_manager.release_lane(self.current_lane)
                 self.current_lane = None
 
-            if not self.path:
+            if self._next_lane is None:
                 self.status = "idle"
             return True
 
@@ -196,17 +266,19 @@ class Robot:
 
     def _is_at_charger(self) -> bool:
         """Check if robot is at charging station"""
-        vertex_data = self.nav_graph.get_vertex_data(self.current_vertex)
-        return vertex_data.get("is_charger", False)
+        # Set membership against the precomputed charger set; no metadata
+        # dict lookups per battery check
+        return self.current_vertex in self.nav_graph.charger_vertices
 
    
     def _log(self, message):
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] Robot {self.id}: {message}"
+        # The timestamped entry is kept in memory for the GUI log panel,
+        # which orders entries by their timestamp prefix
+        log_entry = f"[{_timestamp()}] Robot {self.id}: {message}"
         self.log.append(log_entry)
-        with open("fleet_logs.txt", "a") as f:
-            f.write(log_entry + "\n")
-        print(log_entry)
+        logger.info(log_entry)
+        if DEBUG_LOGS:
+            print(log_entry)
 
     def get_status(self) -> Dict[str, Any]:
         """Get current robot status"""
@@ -216,20 +288,18 @@ class Robot:
             "destination": self.destination,
             "status": self.status,
             "battery": f"{self.battery:.1f}%",
-            "path": self.path.copy(),
+            "path": self.path[self._path_idx:],
             "color": self.color,
             "current_lane": self.current_lane,
             "progress": self.progress
         }
 
-    def get_position(self) -> Tuple[float, float]:
-        """Get interpolated position for smooth rendering"""
-        if not self.current_lane or not self.nav_graph.vertices:
-            return self.nav_graph.vertices[self.current_vertex][:2]
-        
-        start = self.nav_graph.vertices[self.current_lane[0]]
-        end = self.nav_graph.vertices[self.current_lane[1]]
-        return (
-            start[0] + (end[0] - start[0]) * self.progress,
-            start[1] + (end[1] - start[1]) * self.progress
-        )
\ No newline at end of file
+    def get_position(self):
+        """Get interpolated position for smooth rendering as an (x, y) array"""
+        coords = self.nav_graph.coords
+        if not self.current_lane:
+            return coords[self.current_vertex]
+
+        start = coords[self.current_lane[0]]
+        end = coords[self.current_lane[1]]
+        return start + (end - start) * self.progress
\ No newline at end of file
@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.nav_graph import NavGraph
+from controllers.fleet_manager import FleetManager
+from controllers.traffic_manager import TrafficManager
+
+NAV_GRAPH_JSON = os.path.join(os.path.dirname(__file__), '..', 'data', 'nav_graph.json')
+
+
+def test_detect_collisions_survives_first_hop():
+    """Paths start at the robot's own vertex, so the first granted lane is
+    the degenerate (v, v); detect_collisions must keep unpacking into
+    lane pairs while such a lane is held (regression: one-element
+    frozenset crashed the per-frame collision scan)."""
+    nav_graph = NavGraph(NAV_GRAPH_JSON)
+    traffic_manager = TrafficManager(nav_graph)
+    fleet = FleetManager(traffic_manager)
+    robot = fleet.spawn_robot(0, nav_graph)
+    assert robot.assign_task(3)
+
+    for _ in range(80):
+        fleet.update_robots(0.1)
+        for lane1, lane2 in traffic_manager.detect_collisions():
+            assert lane1 == (lane2[1], lane2[0])
+
+    assert robot.current_vertex == 3
+    assert robot.status == "idle"
+
+
+def test_head_on_collision_still_reported():
+    nav_graph = NavGraph(NAV_GRAPH_JSON)
+    traffic_manager = TrafficManager(nav_graph)
+    lane = next(iter(nav_graph.lane_id))
+    reverse = (lane[1], lane[0])
+    traffic_manager._grant_access(1, lane)
+    traffic_manager._grant_access(2, reverse)
+    assert traffic_manager.detect_collisions() == [(lane, reverse)] or \
+        traffic_manager.detect_collisions() == [(reverse, lane)]
+    traffic_manager.release_lane(lane)
+    traffic_manager.release_lane(reverse)
+    assert traffic_manager.detect_collisions() == []